@@ -46,8 +46,7 @@ do
         
         mkdir -p $output
 
-        cargo build --release --bin samizdat-node --target $arch
-        cargo build --release --bin samizdat --target $arch
+        cargo build --release --bin samizdat-node --bin samizdat --target $arch
 
         for artifact in $(cat ./install/node/$arch/artifacts.txt)
         do